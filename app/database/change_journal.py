@@ -0,0 +1,165 @@
+import asyncio
+import threading
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+from sqlalchemy import event, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select, func
+from app.models.models import Products, Sales, InventoryLog, ChangeLog, ChangeCursor
+
+# Models whose writes are recorded in the journal, with their feed name.
+TRACKED_MODELS = {
+    Products: "product",
+    Sales: "sale",
+    InventoryLog: "inventory_log",
+}
+ENTITY_MODELS = {name: model for model, name in TRACKED_MODELS.items()}
+
+_subscribers = set()
+_subscribers_lock = threading.Lock()
+
+
+def record_changes(session: Session, entity: str, entity_ids: Iterable[int], action: str) -> None:
+    """Journal changes made outside the unit of work, e.g. Core UPDATE statements."""
+    session.info.setdefault("change_journal", []).extend(
+        (entity, entity_id, action) for entity_id in entity_ids
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _journal_flush(session: Session, flush_context) -> None:
+    changes = {"insert": session.new, "update": session.dirty, "delete": session.deleted}
+    for action, objects in changes.items():
+        for entity, ids in _group_tracked(session, objects, action).items():
+            record_changes(session, entity, ids, action)
+
+
+@event.listens_for(Session, "before_commit")
+def _write_journal(session: Session) -> None:
+    # Flush first so the changes of the final flush are journaled too.
+    session.flush()
+    pending = session.info.pop("change_journal", None)
+    if not pending:
+        return
+
+    # Taking the cursor row lock here and holding it until commit hands out
+    # cursors in commit order: a later cursor can never become visible
+    # before an earlier one.
+    connection = session.connection()
+    last_cursor = _advance_cursor(connection, len(pending))
+    first_cursor = last_cursor - len(pending) + 1
+    now = datetime.now(timezone.utc)
+    connection.execute(insert(ChangeLog.__table__), [
+        {"id": cursor, "entity": entity, "entity_id": entity_id, "action": action, "createdAt": now}
+        for cursor, (entity, entity_id, action) in enumerate(pending, start=first_cursor)
+    ])
+    session.info["change_journal_pending"] = True
+
+
+def _advance_cursor(connection, count: int) -> int:
+    cursor_table = ChangeCursor.__table__
+    advance = (
+        update(cursor_table)
+        .where(cursor_table.c.id == 1)
+        .values(value=cursor_table.c.value + count)
+    )
+    if connection.execute(advance).rowcount == 0:
+        try:
+            with connection.begin_nested():
+                connection.execute(insert(cursor_table).values(id=1, value=count))
+        except IntegrityError:
+            # Another transaction created the row first; wait for its lock.
+            connection.execute(advance)
+    return connection.execute(
+        select(cursor_table.c.value).where(cursor_table.c.id == 1)
+    ).scalar_one()
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_subscribers(session: Session) -> None:
+    if session.info.pop("change_journal_pending", False):
+        with _subscribers_lock:
+            subscribers = list(_subscribers)
+        for subscriber in subscribers:
+            loop, changed = subscriber
+            try:
+                loop.call_soon_threadsafe(changed.set)
+            except RuntimeError:
+                # The stream's event loop has closed; the write is already
+                # committed, so drop the subscriber rather than fail the caller.
+                with _subscribers_lock:
+                    _subscribers.discard(subscriber)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop("change_journal", None)
+    session.info.pop("change_journal_pending", None)
+
+
+def _group_tracked(session: Session, objects, action: str) -> dict:
+    grouped = {}
+    for obj in objects:
+        tracked = TRACKED_MODELS.get(type(obj))
+        if not tracked:
+            continue
+        if action == "update" and not session.is_modified(obj, include_collections=False):
+            continue
+        grouped.setdefault(tracked, []).append(obj.id)
+    return grouped
+
+
+def subscribe(changed: asyncio.Event) -> None:
+    """Have ``changed`` set whenever a transaction that wrote journal entries commits."""
+    with _subscribers_lock:
+        _subscribers.add((asyncio.get_running_loop(), changed))
+
+
+def unsubscribe(changed: asyncio.Event) -> None:
+    with _subscribers_lock:
+        _subscribers.difference_update({entry for entry in _subscribers if entry[1] is changed})
+
+
+def entity_version(session: Session, entity: str, actions: Optional[Iterable[str]] = None) -> Optional[int]:
+    """Return the latest cursor journaled for ``entity``, optionally limited to ``actions``."""
+    statement = select(func.max(ChangeLog.id)).where(ChangeLog.entity == entity)
+    if actions:
+        statement = statement.where(ChangeLog.action.in_(actions))
+    return session.exec(statement).one()
+
+
+def read_changes(session: Session, since: int, limit: int) -> List[dict]:
+    """Return journal entries after ``since`` in cursor order, with the entity's current state."""
+    entries = session.exec(
+        select(ChangeLog).where(ChangeLog.id > since).order_by(ChangeLog.id).limit(limit)
+    ).all()
+
+    current = _load_entities(session, entries)
+    return [
+        {
+            "cursor": entry.id,
+            "entity": entry.entity,
+            "entity_id": entry.entity_id,
+            "action": entry.action,
+            "created_at": entry.createdAt.isoformat(),
+            "data": current.get((entry.entity, entry.entity_id)) if entry.action != "delete" else None,
+        }
+        for entry in entries
+    ]
+
+
+def _load_entities(session: Session, entries: List[ChangeLog]) -> dict:
+    ids_by_entity = {}
+    for entry in entries:
+        if entry.action != "delete":
+            ids_by_entity.setdefault(entry.entity, set()).add(entry.entity_id)
+
+    current = {}
+    for entity, ids in ids_by_entity.items():
+        model = ENTITY_MODELS[entity]
+        for row in session.exec(select(model).where(model.id.in_(ids))).all():
+            # Dump the row as stored: deleting a product nulls product_id on its
+            # sales, which the request schemas would reject.
+            current[(entity, row.id)] = row.model_dump(mode="json")
+    return current
+
@@ -1,7 +1,8 @@
 import os
 from sqlmodel import SQLModel, create_engine, Session
 from dotenv import load_dotenv
-from app.models.models import Products, Sales, InventoryLog
+from app.models.models import Products, Sales, InventoryLog, ChangeLog, ChangeCursor, ReportJob
+from app.database import change_journal  # noqa: F401  (registers the change journal listeners)
 
 # Load environment variables
 load_dotenv()
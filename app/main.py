@@ -2,7 +2,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from strawberry.fastapi import GraphQLRouter
 from app.database.database import create_db_and_tables
-from app.routers import products, sales, inventory
+from app.routers import products, sales, inventory, changes, reports
 from app.graphql.query import graphql_schema
 
 
@@ -27,6 +27,8 @@ graphql_router = GraphQLRouter(graphql_schema)
 app.include_router(products.router)
 app.include_router(sales.router)
 app.include_router(inventory.router)
+app.include_router(changes.router)
+app.include_router(reports.router)
 
 app.include_router(graphql_router, prefix="/graphql")
 
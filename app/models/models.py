@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from typing import Optional, List
-from sqlmodel import SQLModel, Field, Relationship, Column, func, DateTime
+from sqlalchemy.dialects import mysql
+from sqlmodel import SQLModel, Field, Relationship, Column, DateTime, Text
 
 class Products(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -9,11 +10,13 @@ class Products(SQLModel, table=True):
     category: Optional[str] = Field(default=None, index=True)
     price: Optional[float] = None
     createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
+    # Microsecond precision (DATETIME(6) on MySQL) so that updatedAt, which
+    # backs the products ETag, changes on every write even within one second.
     updatedAt: datetime = Field(
         sa_column=Column(
-            DateTime(timezone=True),
-            default=func.now(),
-            onupdate=func.now(),
+            DateTime(timezone=True).with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            default=lambda: datetime.now(timezone.utc),
+            onupdate=lambda: datetime.now(timezone.utc),
             nullable=False,
             index=True
         )
@@ -43,4 +46,35 @@ class InventoryLog(SQLModel, table=True):
         default_factory=lambda: datetime.now(timezone.utc),
         index=True
     )
-    product: Optional[Products] = Relationship(back_populates="inventory_logs") 
\ No newline at end of file
+    product: Optional[Products] = Relationship(back_populates="inventory_logs")
+
+class ChangeLog(SQLModel, table=True):
+    # The change feed cursor, handed out from ChangeCursor when the writing
+    # transaction commits, so cursor order is commit order.
+    id: int = Field(primary_key=True, sa_column_kwargs={"autoincrement": False})
+    entity: str = Field(index=True)
+    entity_id: int
+    action: str
+    createdAt: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        index=True
+    )
+
+class ChangeCursor(SQLModel, table=True):
+    # Single row holding the last cursor handed out to ChangeLog.
+    id: int = Field(default=1, primary_key=True)
+    value: int = 0
+
+class ReportJob(SQLModel, table=True):
+    # Content hash of the report spec, shared by every API worker.
+    id: str = Field(primary_key=True, max_length=40)
+    spec: str = Field(sa_column=Column(Text, nullable=False))
+    state: str = Field(default="pending", max_length=16)
+    error: Optional[str] = Field(default=None, sa_column=Column(Text))
+    path: str
+    createdAt: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        index=True
+    )
+    startedAt: Optional[datetime] = None
+    finishedAt: Optional[datetime] = None
@@ -0,0 +1,71 @@
+# routers/changes.py
+import asyncio
+import json
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlmodel import Session
+from typing import Optional
+from app.database.database import engine, get_session
+from app.database.change_journal import read_changes, subscribe, unsubscribe
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+STREAM_BATCH_SIZE = 500
+STREAM_POLL_SECONDS = 2
+
+@router.get("/")
+def get_changes(
+    since: int = Query(default=0, ge=0),
+    limit: int = Query(default=500, ge=1, le=5000),
+    session: Session = Depends(get_session)
+):
+    changes = read_changes(session, since, limit)
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "status": "success",
+            "message": f"{len(changes)} change(s) found.",
+            "cursor": changes[-1]["cursor"] if changes else since,
+            "data": changes
+        }
+    )
+
+@router.get("/stream")
+async def stream_changes(
+    since: int = Query(default=0, ge=0),
+    last_event_id: Optional[int] = Header(default=None)
+):
+    # EventSource reconnects send Last-Event-ID, which takes precedence over ?since.
+    cursor = last_event_id if last_event_id is not None else since
+    return StreamingResponse(
+        _change_events(cursor),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+def _load_batch(cursor: int):
+    with Session(engine) as session:
+        return read_changes(session, cursor, STREAM_BATCH_SIZE)
+
+async def _change_events(cursor: int):
+    changed = asyncio.Event()
+    subscribe(changed)
+    try:
+        while True:
+            changed.clear()
+            changes = await run_in_threadpool(_load_batch, cursor)
+            for change in changes:
+                yield f"id: {change['cursor']}\nevent: change\ndata: {json.dumps(change)}\n\n"
+            if changes:
+                cursor = changes[-1]["cursor"]
+                continue
+
+            # Commits in this process wake the stream immediately; the timeout
+            # picks up writes from other workers and keeps the connection alive.
+            try:
+                await asyncio.wait_for(changed.wait(), STREAM_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+    finally:
+        unsubscribe(changed)
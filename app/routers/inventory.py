@@ -1,13 +1,15 @@
 # routers/sales.py
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Header, Response
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sqlmodel import Session, select
-from typing import List
+from typing import List, Optional
 from app.database.database import get_session
+from app.database.change_journal import entity_version
 from app.models.models import Products, InventoryLog
 from app.schemas.schemas import InventoryLogCreate, InventoryLogRead
+from app.utils.helpers import make_etag, etag_matches, not_modified
 
 router = APIRouter(prefix="/inventory", tags=["inventory"])
 
@@ -15,6 +17,10 @@ class InventoryUpdateRequest(BaseModel):
     product_id: int
     new_stock: int
 
+def inventory_logs_etag(session: Session) -> str:
+    # Every inventory log write advances the latest journal cursor for inventory logs.
+    return make_etag("inventory_logs", entity_version(session, "inventory_log"))
+
 @router.get("/status")
 def get_inventory_status(session: Session = Depends(get_session)):
     low_stack_value = 5
@@ -60,10 +66,18 @@ def update_inventory(
     return JSONResponse(status_code=200, content={"status": "success", "message": "Inventory updated and logged"})
 
 @router.get("/logs")
-def get_inventory_logs(session: Session = Depends(get_session)):
+def get_inventory_logs(
+    if_none_match: Optional[str] = Header(default=None),
+    session: Session = Depends(get_session)
+):
+    etag = inventory_logs_etag(session)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     logs = session.exec(select(InventoryLog)).all()
     return JSONResponse(
         status_code=200,
+        headers={"ETag": etag},
         content={
             "status": "success",
             "data": [
@@ -98,8 +112,17 @@ def create_inventory_log(log: InventoryLogCreate, session: Session = Depends(get
     return db_log
 
 @router.get("/", response_model=List[InventoryLogRead])
-def read_inventory_logs(session: Session = Depends(get_session)):
+def read_inventory_logs(
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    session: Session = Depends(get_session)
+):
+    etag = inventory_logs_etag(session)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     logs = session.exec(select(InventoryLog)).all()
+    response.headers["ETag"] = etag
     return logs
 
 @router.get("/{log_id}", response_model=InventoryLogRead)
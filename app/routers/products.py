@@ -1,13 +1,23 @@
 # routes/products.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Header, Response
+from sqlmodel import Session, select, update, func
+from typing import List, Optional
 from app.database.database import get_session
+from app.database.change_journal import record_changes
 from app.models.models import Products
-from app.schemas.schemas import ProductCreate, ProductRead
+from app.schemas.schemas import (
+    ProductCreate,
+    ProductRead,
+    ProductUpdate,
+    ProductBulkUpdate,
+    ProductBulkUpdateResult,
+)
+from app.utils.helpers import make_etag, etag_matches, not_modified
 
 router = APIRouter(prefix="/products", tags=["products"])
 
+NON_NULLABLE_FIELDS = ("name", "stock")
+
 @router.post("/", response_model=ProductRead)
 def create_product(product: ProductCreate, session: Session = Depends(get_session)):
     db_product = Products(**product.model_dump())
@@ -17,15 +27,44 @@ def create_product(product: ProductCreate, session: Session = Depends(get_sessio
     return db_product
 
 @router.get("/", response_model=List[ProductRead])
-def read_products(session: Session = Depends(get_session)):
+def read_products(
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    session: Session = Depends(get_session)
+):
+    last_updated, total = session.exec(
+        select(func.max(Products.updatedAt), func.count(Products.id))
+    ).one()
+    etag = make_etag("products", last_updated, total)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     products = session.exec(select(Products)).all()
+    response.headers["ETag"] = etag
     return products
 
 @router.get("/{product_id}", response_model=ProductRead)
-def read_product(product_id: int, session: Session = Depends(get_session)):
+def read_product(
+    product_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    session: Session = Depends(get_session)
+):
+    if if_none_match:
+        # Compare against the indexed updatedAt before loading the full row.
+        updated_at = session.exec(
+            select(Products.updatedAt).where(Products.id == product_id)
+        ).first()
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail="Product not found")
+        etag = make_etag("product", product_id, updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
     product = session.get(Products, product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
+    response.headers["ETag"] = make_etag("product", product.id, product.updatedAt)
     return product
 
 @router.put("/{product_id}", response_model=ProductRead)
@@ -42,6 +81,72 @@ def update_product(product_id: int, product: ProductCreate, session: Session = D
     session.refresh(db_product)
     return db_product
 
+@router.patch("/bulk", response_model=List[ProductBulkUpdateResult])
+def bulk_update_products(items: List[ProductBulkUpdate], session: Session = Depends(get_session)):
+    requested_ids = {item.id for item in items}
+    existing_ids = set(
+        session.exec(select(Products.id).where(Products.id.in_(requested_ids))).all()
+    ) if requested_ids else set()
+
+    results = []
+    rows = []
+    for item in items:
+        changes = item.model_dump(exclude_unset=True, exclude={"id"})
+        if item.id not in existing_ids:
+            results.append(ProductBulkUpdateResult(id=item.id, status="not_found", detail="Product not found"))
+        elif any(changes.get(key, ...) is None for key in NON_NULLABLE_FIELDS):
+            results.append(ProductBulkUpdateResult(id=item.id, status="invalid", detail="name and stock cannot be null"))
+        elif not changes:
+            results.append(ProductBulkUpdateResult(id=item.id, status="unchanged"))
+        else:
+            rows.append({"id": item.id, **changes})
+            results.append(ProductBulkUpdateResult(id=item.id, status="updated"))
+
+    # ORM bulk UPDATE by primary key: rows sharing the same set of columns
+    # are sent as a single executemany, all inside one transaction.
+    if rows:
+        session.execute(update(Products), rows)
+        record_changes(session, "product", [row["id"] for row in rows], "update")
+    session.commit()
+    return results
+
+@router.patch("/{product_id}", response_model=ProductRead)
+def patch_product(product_id: int, product: ProductUpdate, session: Session = Depends(get_session)):
+    changes = product.model_dump(exclude_unset=True)
+    if any(changes.get(key, ...) is None for key in NON_NULLABLE_FIELDS):
+        raise HTTPException(status_code=422, detail="name and stock cannot be null")
+    if not changes:
+        product = session.get(Products, product_id)
+        if not product:
+            raise HTTPException(status_code=404, detail="Product not found")
+        return product
+
+    statement = (
+        update(Products)
+        .where(Products.id == product_id)
+        .values(**changes)
+        .execution_options(synchronize_session=False)
+    )
+
+    if session.get_bind().dialect.update_returning:
+        db_product = session.execute(statement.returning(Products)).scalar_one_or_none()
+        if not db_product:
+            raise HTTPException(status_code=404, detail="Product not found")
+        # Serialize before commit so the expired instance is not reloaded.
+        result = ProductRead.model_validate(db_product)
+        record_changes(session, "product", [product_id], "update")
+        session.commit()
+        return result
+
+    # MySQL has no UPDATE ... RETURNING, so read the row back in the same transaction.
+    if session.execute(statement).rowcount == 0:
+        raise HTTPException(status_code=404, detail="Product not found")
+    db_product = session.get(Products, product_id, populate_existing=True)
+    result = ProductRead.model_validate(db_product)
+    record_changes(session, "product", [product_id], "update")
+    session.commit()
+    return result
+
 @router.delete("/{product_id}")
 def delete_product(product_id: int, session: Session = Depends(get_session)):
     product = session.get(Products, product_id)
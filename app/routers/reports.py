@@ -0,0 +1,42 @@
+# routers/reports.py
+import os
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from sqlmodel import Session
+from app.database.database import get_session
+from app.models.models import ReportJob
+from app.schemas.schemas import ReportCreate, ReportJobRead
+from app.utils.reports import MEDIA_TYPES, submit_report, get_report_job
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+def _job_read(job: ReportJob) -> ReportJobRead:
+    return ReportJobRead(job_id=job.id, state=job.state, error=job.error)
+
+@router.post("/", response_model=ReportJobRead, status_code=status.HTTP_202_ACCEPTED)
+def create_report(spec: ReportCreate, session: Session = Depends(get_session)):
+    return _job_read(submit_report(spec, session))
+
+@router.get("/{job_id}", response_model=ReportJobRead)
+def read_report(job_id: str, session: Session = Depends(get_session)):
+    job = get_report_job(session, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    return _job_read(job)
+
+@router.get("/{job_id}/download")
+def download_report(job_id: str, session: Session = Depends(get_session)):
+    job = get_report_job(session, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    if job.state != "completed":
+        raise HTTPException(status_code=409, detail=f"Report is {job.state}")
+    if not os.path.exists(job.path):
+        raise HTTPException(status_code=404, detail="Report file not found")
+
+    spec = ReportCreate.model_validate_json(job.spec)
+    return FileResponse(
+        job.path,
+        media_type=MEDIA_TYPES[spec.format],
+        filename=f"sales_report_{spec.group_by.value}.{spec.format.value}"
+    )
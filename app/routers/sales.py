@@ -1,19 +1,38 @@
 # routers/sales.py
-from fastapi import APIRouter, Query, Depends, status, HTTPException
+from fastapi import APIRouter, Query, Depends, status, HTTPException, Header, Response
 from fastapi.responses import JSONResponse
 from sqlmodel import Session, select, func
 from typing import Optional, List
 from datetime import datetime
 from app.database.database import get_session
+from app.database.change_journal import entity_version
 from app.models.models import Products, Sales
 from app.schemas.schemas import SaleCreate, SaleRead
-from app.utils.helpers import Period, map_for_analyzing_data, generate_filters
+from app.utils.helpers import (
+    Period,
+    map_for_analyzing_data,
+    generate_filters,
+    make_etag,
+    etag_matches,
+    not_modified,
+)
 
 router = APIRouter(prefix="/sales", tags=["sales"])
 
 @router.get("/all", response_model=List[SaleRead])
-def read_sales(session: Session = Depends(get_session)):
+def read_sales(
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    session: Session = Depends(get_session)
+):
+    # Every sale write, including the product_id rewrite when a product is
+    # deleted, advances the latest journal cursor for sales.
+    etag = make_etag("sales", entity_version(session, "sale"))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     sales = session.exec(select(Sales)).all()
+    response.headers["ETag"] = etag
     return sales
 
 
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel
+from app.utils.helpers import Period, ReportFormat
 
 class ProductBase(BaseModel):
     name: str
@@ -11,6 +12,20 @@ class ProductBase(BaseModel):
 class ProductCreate(ProductBase):
     pass
 
+class ProductUpdate(BaseModel):
+    name: Optional[str] = None
+    stock: Optional[int] = None
+    category: Optional[str] = None
+    price: Optional[float] = None
+
+class ProductBulkUpdate(ProductUpdate):
+    id: int
+
+class ProductBulkUpdateResult(BaseModel):
+    id: int
+    status: str
+    detail: Optional[str] = None
+
 class ProductRead(ProductBase):
     id: int
     createdAt: datetime
@@ -30,6 +45,8 @@ class SaleCreate(SaleBase):
 
 class SaleRead(SaleBase):
     id: int
+    # Nulled when the product is deleted.
+    product_id: Optional[int] = None
     createdAt: datetime
 
     class Config:
@@ -48,4 +65,17 @@ class InventoryLogRead(InventoryLogBase):
     createdAt: datetime
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True 
+
+class ReportCreate(BaseModel):
+    group_by: Period = Period.Monthly
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    medium: Optional[str] = None
+    product_id: Optional[int] = None
+    format: ReportFormat = ReportFormat.PDF
+
+class ReportJobRead(BaseModel):
+    job_id: str
+    state: str
+    error: Optional[str] = None
@@ -1,5 +1,10 @@
+import hashlib
 from datetime import datetime, timezone
 from enum import Enum
+from fastapi import Response
+from sqlalchemy import String, literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
 from sqlmodel import SQLModel, func
 from typing import Optional, List, Tuple
 
@@ -9,6 +14,10 @@ class Period(str, Enum):
     Monthly = "monthly"
     Yearly = "yearly"
 
+class ReportFormat(str, Enum):
+    PDF = "pdf"
+    CSV = "csv"
+
 def convert_to_datetime(date_str: str) -> datetime:
     """Convert string to datetime object."""
     return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
@@ -39,11 +48,55 @@ def generate_filters(
     
     return filters
 
+class format_period(FunctionElement):
+    """Format a datetime column as a period label, e.g. ``format_period(column, "%Y-%m")``.
+
+    Takes SQLite ``strftime`` formats (``%Y-%W``, ``%Y-%m`` or ``%Y``) and
+    compiles to the MySQL expression producing the same label.
+    """
+    type = String()
+    inherit_cache = True
+
+@compiles(format_period)
+def _format_period_default(element, compiler, **kw):
+    column, fmt = element.clauses
+    return f"strftime({compiler.process(fmt, **kw)}, {compiler.process(column, **kw)})"
+
+@compiles(format_period, "mysql")
+def _format_period_mysql(element, compiler, **kw):
+    column, fmt = element.clauses
+    column_sql = compiler.process(column, **kw)
+    if fmt.value == "%Y-%W":
+        # No DATE_FORMAT specifier matches SQLite %W (weeks start on Monday and
+        # days before the first Monday are week 00); WEEK() mode 5 does.
+        year = compiler.process(literal("%Y"), **kw)
+        return f"CONCAT(DATE_FORMAT({column_sql}, {year}), '-', LPAD(WEEK({column_sql}, 5), 2, '0'))"
+    return f"DATE_FORMAT({column_sql}, {compiler.process(fmt, **kw)})"
+
 def map_for_analyzing_data(column: datetime) -> dict:
     """Map period types to SQL functions for data analysis."""
     return {
         Period.Daily: func.date(column),
-        Period.Weekly: func.strftime('%Y-%W', column),
-        Period.Monthly: func.strftime('%Y-%m', column),
-        Period.Yearly: func.strftime('%Y', column)
+        Period.Weekly: format_period(column, literal("%Y-%W")),
+        Period.Monthly: format_period(column, literal("%Y-%m")),
+        Period.Yearly: format_period(column, literal("%Y"))
     }
+
+def make_etag(*parts) -> str:
+    """Build a strong ETag from the given validator values."""
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+def not_modified(etag: str) -> Response:
+    """Return an empty 304 response carrying the current ETag."""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,238 @@
+import csv
+import hashlib
+import multiprocessing
+import os
+import threading
+from datetime import datetime, timezone, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from fpdf import FPDF
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select, func
+from app.database.database import engine
+from app.database.change_journal import entity_version
+from app.models.models import Sales, ReportJob
+from app.schemas.schemas import ReportCreate
+from app.utils.helpers import ReportFormat, generate_filters, map_for_analyzing_data
+
+REPORTS_DIR = os.getenv("REPORTS_DIR", "reports")
+REPORT_WORKERS = int(os.getenv("REPORT_WORKERS", "2"))
+REPORT_FETCH_SIZE = 1000
+# Sales committing right at the end of a range are still in flight for a moment,
+# so a range only counts as closed once its end is this far in the past.
+CLOSED_RANGE_SETTLE = timedelta(minutes=1)
+REPORT_TTL = timedelta(hours=int(os.getenv("REPORT_TTL_HOURS", "24")))
+REPORT_JOB_TIMEOUT = timedelta(minutes=15)
+REPORT_CLEANUP_INTERVAL = timedelta(minutes=10)
+
+MEDIA_TYPES = {
+    ReportFormat.PDF: "application/pdf",
+    ReportFormat.CSV: "text/csv",
+}
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_last_cleanup: Optional[datetime] = None
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawn rather than fork: the API process is multi-threaded, and spawned
+            # workers open their own database connections.
+            _pool = ProcessPoolExecutor(
+                max_workers=REPORT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+def _report_filters(spec: ReportCreate) -> list:
+    return generate_filters(
+        Sales,
+        created_at=Sales.createdAt,
+        start_date=spec.start_date,
+        end_date=spec.end_date,
+        medium=(Sales.medium_of_sales, spec.medium),
+        product_id=spec.product_id,
+    )
+
+def _report_key(spec: ReportCreate, session: Session) -> str:
+    # Existing sales are rewritten (e.g. product_id is nulled when their product is
+    # deleted), so every key includes the latest journaled sale update or delete.
+    key = f"{spec.model_dump_json()}:{entity_version(session, 'sale', ('update', 'delete'))}"
+    end_date = spec.end_date
+    if end_date and end_date.tzinfo is None:
+        end_date = end_date.replace(tzinfo=timezone.utc)
+    if end_date and end_date < datetime.now(timezone.utc) - CLOSED_RANGE_SETTLE:
+        # createdAt is server-set, so no new sale can land in a closed range.
+        return key
+
+    # Open range: max(id) and count of the matching sales identify the inserts in the report.
+    last_id, total = session.exec(
+        select(func.max(Sales.id), func.count(Sales.id)).where(*_report_filters(spec))
+    ).one()
+    return f"{key}:{last_id}:{total}"
+
+def _is_live(job: ReportJob) -> bool:
+    if job.state == "completed":
+        return os.path.exists(job.path)
+    if job.state == "pending":
+        # Queue time is unbounded under load; a pending job lost in a restart
+        # is removed by cleanup_reports once it outlives REPORT_TTL.
+        return True
+    if job.state == "running":
+        # A job running past the timeout was lost with the worker that ran it.
+        return _as_utc(job.startedAt) > datetime.now(timezone.utc) - REPORT_JOB_TIMEOUT
+    return False
+
+def submit_report(spec: ReportCreate, session: Session) -> ReportJob:
+    """Queue a report, reusing the job of an identical spec over unchanged sales data."""
+    cleanup_reports(session)
+    job_id = hashlib.sha1(_report_key(spec, session).encode()).hexdigest()
+    job = session.get(ReportJob, job_id)
+    if job and _is_live(job):
+        return job
+
+    if job:
+        job.state = "pending"
+        job.error = None
+        job.createdAt = datetime.now(timezone.utc)
+        job.startedAt = None
+        job.finishedAt = None
+    else:
+        path = os.path.join(REPORTS_DIR, f"{job_id}.{spec.format.value}")
+        job = ReportJob(id=job_id, spec=spec.model_dump_json(), path=path)
+    session.add(job)
+    try:
+        session.commit()
+    except IntegrityError:
+        # Another API worker queued the same report first.
+        session.rollback()
+        return session.get(ReportJob, job_id)
+
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    _get_pool().submit(build_report, job_id)
+    return job
+
+def get_report_job(session: Session, job_id: str) -> Optional[ReportJob]:
+    return session.get(ReportJob, job_id)
+
+def cleanup_reports(session: Session):
+    """Delete report jobs and files older than REPORT_TTL, at most once per interval per process."""
+    global _last_cleanup
+    now = datetime.now(timezone.utc)
+    if _last_cleanup and now - _last_cleanup < REPORT_CLEANUP_INTERVAL:
+        return
+    _last_cleanup = now
+    cutoff = now - REPORT_TTL
+
+    for job in session.exec(select(ReportJob).where(ReportJob.createdAt < cutoff)).all():
+        _remove_file(job.path)
+        session.delete(job)
+    session.commit()
+
+    # Leftover temp files and files whose job row is already gone.
+    if os.path.isdir(REPORTS_DIR):
+        for entry in os.scandir(REPORTS_DIR):
+            if entry.is_file() and entry.stat().st_mtime < cutoff.timestamp():
+                _remove_file(entry.path)
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def build_report(job_id: str):
+    """Render a report job to its path and record the outcome. Runs inside a report worker process."""
+    with Session(engine) as session:
+        job = session.get(ReportJob, job_id)
+        if not job:
+            return
+        job.state = "running"
+        job.startedAt = datetime.now(timezone.utc)
+        session.commit()
+        try:
+            _render_report(ReportCreate.model_validate_json(job.spec), job.path, session)
+        except Exception as exc:
+            session.rollback()
+            _remove_file(f"{job.path}.tmp")
+            job.state = "failed"
+            job.error = str(exc)
+        else:
+            job.state = "completed"
+        job.finishedAt = datetime.now(timezone.utc)
+        session.commit()
+
+def _render_report(spec: ReportCreate, path: str, session: Session):
+    period_label = map_for_analyzing_data(Sales.createdAt)[spec.group_by].label("period")
+    filters = _report_filters(spec)
+    statement = (
+        select(
+            period_label,
+            Sales.medium_of_sales,
+            func.count(Sales.id).label("total_sales"),
+            func.sum(Sales.total_price).label("revenue")
+        )
+        .where(*filters)
+        .group_by(period_label, Sales.medium_of_sales)
+        .order_by(period_label, Sales.medium_of_sales)
+        .execution_options(yield_per=REPORT_FETCH_SIZE)
+    )
+
+    tmp_path = f"{path}.tmp"
+    rows = (
+        (str(row.period), row.medium_of_sales, row.total_sales, float(row.revenue or 0.0))
+        for row in session.exec(statement)
+    )
+    if spec.format == ReportFormat.CSV:
+        _write_csv(rows, tmp_path)
+    else:
+        _write_pdf(rows, spec, tmp_path)
+    os.replace(tmp_path, path)
+
+def _write_csv(rows, path: str):
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["period", "medium_of_sales", "total_sales", "revenue"])
+        writer.writerows(rows)
+
+def _write_pdf(rows, spec: ReportCreate, path: str):
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", "B", 14)
+    pdf.cell(0, 10, f"Sales revenue report ({spec.group_by.value})", ln=1)
+    pdf.set_font("Arial", size=9)
+    start = spec.start_date.isoformat() if spec.start_date else "beginning"
+    end = spec.end_date.isoformat() if spec.end_date else "now"
+    pdf.cell(0, 6, _latin1(f"From {start} to {end}, medium: {spec.medium or 'all'}, product: {spec.product_id or 'all'}"), ln=1)
+    pdf.ln(4)
+
+    widths = (40, 70, 30, 40)
+    pdf.set_font("Arial", "B", 10)
+    for width, title in zip(widths, ("Period", "Medium", "Sales", "Revenue")):
+        pdf.cell(width, 7, title, border=1)
+    pdf.ln()
+
+    pdf.set_font("Arial", size=10)
+    total_sales, total_revenue = 0, 0.0
+    for period, medium, sales, revenue in rows:
+        for width, value in zip(widths, (period, medium, str(sales), f"{revenue:.2f}")):
+            pdf.cell(width, 7, _latin1(value), border=1)
+        pdf.ln()
+        total_sales += sales
+        total_revenue += revenue
+
+    pdf.set_font("Arial", "B", 10)
+    for width, value in zip(widths, ("Total", "", str(total_sales), f"{total_revenue:.2f}")):
+        pdf.cell(width, 7, value, border=1)
+    pdf.output(path, "F")
+
+def _latin1(text: str) -> str:
+    # The core PDF fonts only cover Latin-1.
+    return text.encode("latin-1", "replace").decode("latin-1")
@@ -0,0 +1,25 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+from app.database.database import get_session
+from app.routers import products, sales, inventory, changes
+
+
+@pytest.fixture
+def client():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+
+    def get_test_session():
+        with Session(engine) as session:
+            yield session
+
+    app = FastAPI()
+    for module in (products, sales, inventory, changes):
+        app.include_router(module.router)
+    app.dependency_overrides[get_session] = get_test_session
+    return TestClient(app)
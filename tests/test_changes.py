@@ -0,0 +1,27 @@
+def test_changes_survive_deleting_product_with_sales(client):
+    product = client.post("/products/", json={"name": "Echo Dot", "stock": 5, "price": 49.99}).json()
+    client.post("/sales/", json={"product_id": product["id"], "quantity": 1, "medium_of_sales": "Amazon"})
+    assert client.delete(f"/products/{product['id']}").status_code == 200
+
+    response = client.get("/changes/", params={"since": 0})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [(change["entity"], change["action"]) for change in data][-1] == ("product", "delete")
+    sale_updates = [c for c in data if c["entity"] == "sale" and c["action"] == "update"]
+    assert sale_updates and sale_updates[-1]["data"]["product_id"] is None
+
+
+def test_change_cursors_are_contiguous_and_skip_rolled_back_writes(client):
+    product = client.post("/products/", json={"name": "Smart TV", "stock": 1}).json()
+    assert client.post(
+        "/sales/", json={"product_id": product["id"], "quantity": 5, "medium_of_sales": "Walmart"}
+    ).status_code == 400
+    client.patch(f"/products/{product['id']}", json={"price": 299.99})
+
+    response = client.get("/changes/", params={"since": 0}).json()
+
+    assert [change["cursor"] for change in response["data"]] == [1, 2]
+    assert [change["action"] for change in response["data"]] == ["insert", "update"]
+    assert response["cursor"] == 2
+    assert client.get("/changes/", params={"since": 1}).json()["data"][0]["cursor"] == 2
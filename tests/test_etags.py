@@ -0,0 +1,21 @@
+def test_sales_etag_changes_when_product_delete_rewrites_sales(client):
+    product = client.post("/products/", json={"name": "Office Chair", "stock": 3}).json()
+    client.post("/sales/", json={"product_id": product["id"], "quantity": 1, "medium_of_sales": "Amazon"})
+    etag = client.get("/sales/all").headers["ETag"]
+    assert client.get("/sales/all", headers={"If-None-Match": etag}).status_code == 304
+
+    client.delete(f"/products/{product['id']}")
+
+    assert client.get("/sales/all", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_product_etag_returns_304_until_product_changes(client):
+    product = client.post("/products/", json={"name": "Microwave", "stock": 7}).json()
+    etag = client.get(f"/products/{product['id']}").headers["ETag"]
+    assert client.get(f"/products/{product['id']}", headers={"If-None-Match": etag}).status_code == 304
+
+    client.patch(f"/products/{product['id']}", json={"stock": 6})
+
+    response = client.get(f"/products/{product['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,25 @@
+from datetime import datetime
+from sqlalchemy.dialects import mysql
+from sqlmodel import SQLModel, Session, create_engine, select
+from app.models.models import Sales
+from app.utils.helpers import Period, map_for_analyzing_data
+
+
+def test_weekly_period_compiles_to_week_mode_5_on_mysql():
+    weekly = map_for_analyzing_data(Sales.createdAt)[Period.Weekly]
+
+    sql = str(select(weekly).compile(dialect=mysql.dialect()))
+
+    assert "WEEK(sales.`createdAt`, 5)" in sql
+    assert "%u" not in sql
+
+
+def test_weekly_period_counts_days_before_first_monday_as_week_00():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    weekly = map_for_analyzing_data(Sales.createdAt)[Period.Weekly]
+    with Session(engine) as session:
+        session.add(Sales(quantity=1, medium_of_sales="Amazon", createdAt=datetime(2025, 1, 1)))
+        session.commit()
+
+        assert session.exec(select(weekly)).one() == "2025-00"